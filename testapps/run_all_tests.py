@@ -7,16 +7,37 @@ import subprocess
 import sys
 import time
 import logging
+import logging.handlers
 import os
 import argparse
-import threading
 import queue
-import select
+import selectors
+import shlex
+import signal
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from itertools import product
+from itertools import count, product
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
+# Per-test logs are streamed to disk through a buffer of this size
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Number of trailing output lines kept in memory per stream
+OUTPUT_TAIL_LINES = 200
+
+# Test outcome markers printed by the timer_stress firmware
+TEST_COMPLETED = "Test completed"
+MONOTONIC_VIOLATION = "Timer monotonic violation"
+
+# How much captured output to show on the console when a test fails
+FAILURE_TAIL_CHARS = 2000
+
+# Seconds interrupted children get to exit after SIGINT (e.g. probe-rs detaching) before SIGKILL
+INTERRUPT_GRACE_PERIOD = 5.0
+
 @dataclass
 class TestResult:
     config: str
@@ -28,7 +49,38 @@ class TestResult:
     error: str = ""
 
 class TestRunner:
-    def __init__(self, board_dir: str, specific_test_id: Optional[str] = None, release_mode: bool = True, include_invalid: bool = False, build_only: bool = False):
+    # Short test ID codes for each feature option
+    # Frequency mapping: target-target -> A, target-below -> B, target-above -> C
+    _FREQ_MAP = {"freq-target-target": "A", "freq-target-below": "B", "freq-target-above": "C"}
+
+    # Block mapping: none -> N, timer1 -> 1, timer2 -> 2, both -> B
+    _BLOCK_MAP = {"block-none": "N", "block-timer1": "1", "block-timer2": "2", "block-both": "B"}
+
+    # Duration mapping: short -> S, full -> F
+    _DURATION_MAP = {"duration-short": "S", "duration-full": "F"}
+
+    # Reload mapping: normal -> N, small -> S
+    _RELOAD_MAP = {"reload-normal": "N", "reload-small": "S"}
+
+    # Priority mapping: compact single character codes
+    _PRIORITY_MAP = {
+        "priority-equal": "E",         # All equal
+        "priority-systick-high": "S",  # SysTick high, timers med
+        "priority-timer1-high": "1",   # Timer1 high, others med
+        "priority-timer2-high": "2",   # Timer2 high, others med
+        "priority-mixed-1": "M",       # SysTick high, Timer1 high, Timer2 low
+        "priority-mixed-2": "L",       # SysTick high, Timer1 med, Timer2 low
+        "priority-mixed-3": "R",       # SysTick high, Timer1 low, Timer2 med
+        "priority-timers-high": "X"     # Timers high, SysTick low (INVALID)
+    }
+
+    # Run order ranks: short-duration tests first, other options in alphabetical order
+    _DURATION_RANK = {"duration-short": 0, "duration-full": 1}
+    _FREQ_RANK = {"freq-target-above": 0, "freq-target-below": 1, "freq-target-target": 2}
+    _BLOCK_RANK = {"block-both": 0, "block-none": 1, "block-timer1": 2, "block-timer2": 3}
+    _RELOAD_RANK = {"reload-normal": 0, "reload-small": 1}
+
+    def __init__(self, board_dir: str, specific_test_id: Optional[str] = None, release_mode: bool = True, include_invalid: bool = False, build_only: bool = False, jobs: Optional[int] = None, stream_output: bool = False, inter_test_delay: Optional[float] = None):
         # Configuration options (mutually exclusive groups)
         self.freq_options = ["freq-target-target", "freq-target-below", "freq-target-above"]
         self.block_options = ["block-none", "block-timer1", "block-timer2", "block-both"]
@@ -41,22 +93,72 @@ class TestRunner:
 
         self.results: List[TestResult] = []
         self.failed_tests: List[TestResult] = []
-        self.board_dir = board_dir
+        # Absolute, so every cargo invocation gets a cwd that needs no further resolving
+        self.board_dir = os.path.abspath(board_dir)
+        # Fixed part of the cargo command line; each test only appends its features
+        self._base_cmd = ["cargo", "build" if build_only else "run", "--bin", "timer_stress", "--no-default-features"]
+        self._release_suffix = ["--release"] if release_mode else []
         self.specific_test_id = specific_test_id
         self.release_mode = release_mode
         self.include_invalid = include_invalid
         self.build_only = build_only
-
-        # Create logs directory
+        # Echo child output live; otherwise it is only captured and shown on failure
+        self.stream_output = stream_output
+        # Pause between serial tests (run mode keeps the original settle time for the board)
+        if inter_test_delay is None:
+            inter_test_delay = 0.1 if build_only else 1.0
+        self.inter_test_delay = inter_test_delay
+        # Parallel workers for build-only sweeps (run mode needs the board, so stays serial)
+        if jobs is None:
+            jobs = os.cpu_count() or 1
+        self.jobs = jobs
+        # Persistent cargo target directory, so dependencies are only built once.
+        # Parallel workers each use their own suffixed copy to avoid cargo's build lock.
+        self.target_dir = os.path.abspath("target-testrunner")
+        self.target_dirs: "queue.Queue[str]" = queue.Queue()
+        # rustc jobs per cargo invocation; split across workers in parallel mode (None: cargo default)
+        self.cargo_jobs: Optional[int] = None
+        # Running child processes, so they can be killed on interrupt
+        self.active_processes = set()
+        # Guards active_processes; once stop_requested is set, no new children are started
+        self.process_lock = threading.Lock()
+        self.stop_requested = threading.Event()
+        # Wall-clock start of run_all_tests; parallel builds overlap, so summed durations overstate it
+        self.run_start: Optional[float] = None
+
+        # Lookup sets for is_config_invalid
+        self._invalid_priorities_set = frozenset(self.invalid_priorities)
+        self._debug_blocks_excluded = frozenset() if release_mode else frozenset(
+            block for block in self.block_options if block != "block-none"
+        )
+
+        # The configuration set is fixed for the runner's lifetime, so compute it once
+        self._id_suffix = "-R" if release_mode else ""
+        self._id_cache = {
+            config: f"{self._FREQ_MAP[config[0]]}{self._BLOCK_MAP[config[1]]}{self._DURATION_MAP[config[2]]}"
+                    f"{self._RELOAD_MAP[config[3]]}{self._PRIORITY_MAP[config[4]]}{self._id_suffix}"
+            for config in product(self.freq_options, self.block_options, self.duration_options,
+                                  self.reload_options, self.priority_options)
+        }
+        self._all_configs = self._compute_all_configs()
+        self._by_id = {self.config_to_id(config): config for config in self._all_configs}
+        self._invalid_count = sum(1 for config in product(
+            self.freq_options, self.block_options, self.duration_options,
+            self.reload_options, self.priority_options
+        ) if self.is_config_invalid(config))
+
+        # Create logs directory; per-test logs are named <run tag>_<sequence>_<test id>.log
+        # so they sort in start order and never collide, even with parallel workers
         os.makedirs("logs", exist_ok=True)
+        self.run_tag = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.log_sequence = count(1)
 
         # Setup logging
         self.setup_logging()
 
     def setup_logging(self):
         """Setup logging to both stdout and file."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_filename = f"systick_test_results_{timestamp}.log"
+        log_filename = f"systick_test_results_{self.run_tag}.log"
 
         # Create logger
         logger = logging.getLogger()
@@ -75,25 +177,29 @@ class TestRunner:
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(formatter)
 
-        # Add handlers to logger
+        # Console output stays synchronous so it interleaves correctly with --stream output.
+        # File records go through a queue so parallel workers never block on file writes;
+        # a listener thread does the actual writing.
         logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self.log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self.log_listener.start()
 
         self.logger = logger
         self.log_filename = log_filename
 
     def is_config_invalid(self, config: Tuple[str, str, str, str, str]) -> bool:
         """Check if a configuration violates design constraints."""
-        freq, block, duration, reload, priority = config
-
-        # Priority-reverse always invalid (SysTick lower priority)
-        if priority in self.invalid_priorities:
-            return True
-
-        # Debug mode: critical sections cause excessive overhead
-        return not self.release_mode and block != "block-none"
+        # Priority-reverse always invalid (SysTick lower priority);
+        # debug mode: critical sections cause excessive overhead, so blocking configs are excluded
+        return config[4] in self._invalid_priorities_set or config[1] in self._debug_blocks_excluded
 
     def generate_all_configs(self) -> List[Tuple[str, str, str, str, str]]:
+        """Return all feature combinations, optionally filtering invalid ones."""
+        return list(self._all_configs)
+
+    def _compute_all_configs(self) -> List[Tuple[str, str, str, str, str]]:
         """Generate all possible feature combinations, optionally filtering invalid ones."""
         all_configs = list(product(
             self.freq_options,
@@ -116,66 +222,53 @@ class TestRunner:
 
     def config_to_id(self, config: Tuple[str, str, str, str, str]) -> str:
         """Convert config tuple to short meaningful ID."""
-        freq, block, duration, reload, priority = config
-
-        # Frequency mapping: target-target -> A, target-below -> B, target-above -> C
-        freq_map = {"freq-target-target": "A", "freq-target-below": "B", "freq-target-above": "C"}
-
-        # Block mapping: none -> N, timer1 -> 1, timer2 -> 2, both -> B
-        block_map = {"block-none": "N", "block-timer1": "1", "block-timer2": "2", "block-both": "B"}
-
-        # Duration mapping: short -> S, full -> F
-        duration_map = {"duration-short": "S", "duration-full": "F"}
-
-        # Reload mapping: normal -> N, small -> S
-        reload_map = {"reload-normal": "N", "reload-small": "S"}
-
-        # Priority mapping: compact single character codes
-        priority_map = {
-            "priority-equal": "E",         # All equal
-            "priority-systick-high": "S",  # SysTick high, timers med
-            "priority-timer1-high": "1",   # Timer1 high, others med
-            "priority-timer2-high": "2",   # Timer2 high, others med
-            "priority-mixed-1": "M",       # SysTick high, Timer1 high, Timer2 low
-            "priority-mixed-2": "L",       # SysTick high, Timer1 med, Timer2 low
-            "priority-mixed-3": "R",       # SysTick high, Timer1 low, Timer2 med
-            "priority-timers-high": "X"     # Timers high, SysTick low (INVALID)
-        }
-
-        base_id = f"{freq_map[freq]}{block_map[block]}{duration_map[duration]}{reload_map[reload]}{priority_map[priority]}"
-        return f"{base_id}-R" if self.release_mode else base_id
+        return self._id_cache[config]
+
+    def cargo_env(self, target_dir: str) -> dict:
+        """Environment for cargo invocations using the given target directory."""
+        env = {**os.environ, "CARGO_TARGET_DIR": target_dir}
+        if self.cargo_jobs is not None:
+            env["CARGO_BUILD_JOBS"] = str(self.cargo_jobs)
+        return env
+
+    def warm_up(self, target_dir: str):
+        """Pre-build dependencies into target_dir (best-effort).
+
+        Feature groups are mutually exclusive, so the default feature set is
+        built; dependencies don't depend on the selected features.
+        """
+        warm_cmd = ["cargo", "build", "--bin", "timer_stress", *self._release_suffix]
+        self.logger.info("Warming up cargo cache in %s...", target_dir)
+        try:
+            completed = subprocess.run(
+                warm_cmd,
+                cwd=self.board_dir,
+                env=self.cargo_env(target_dir),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            if completed.returncode != 0:
+                self.logger.warning("  Warm-up build failed (exit code %s), continuing", completed.returncode)
+        except Exception as e:
+            self.logger.warning("  Warm-up build failed: %s", e)
 
-    def run_single_test(self, config: Tuple[str, str, str, str, str]) -> TestResult:
+    def run_single_test(self, config: Tuple[str, str, str, str, str], target_dir: Optional[str] = None) -> TestResult:
         """Run a single test configuration."""
+        target_dir = target_dir or self.target_dir
         config_str = self.config_to_string(config)
         test_id = self.config_to_id(config)
 
         # Warn about invalid configurations
         if self.is_config_invalid(config):
-            self.logger.warning(f"Testing INVALID configuration (violates design constraints): {config_str} [ID: {test_id}]")
+            self.logger.warning("Testing INVALID configuration (violates design constraints): %s [ID: %s]", config_str, test_id)
             self.logger.warning("This test is expected to fail catastrophically - it demonstrates ISR starvation limits")
         else:
-            self.logger.info(f"Testing: {config_str} [ID: {test_id}]")
-
-        # Command selection based on build_only flag
-        if self.build_only:
-            run_cmd = [
-                "cargo", "build", "--bin", "timer_stress",
-                "--no-default-features",
-                "--features", config_str
-            ]
-        else:
-            run_cmd = [
-                "cargo", "run", "--bin", "timer_stress",
-                "--no-default-features",
-                "--features", config_str
-            ]
-        if self.release_mode:
-            run_cmd.append("--release")
+            self.logger.info("Testing: %s [ID: %s]", config_str, test_id)
+
+        run_cmd = self._base_cmd + ["--features", config_str, *self._release_suffix]
 
         start_time = time.time()
-        timestamp = datetime.now().strftime("%H_%M_%S")
-        log_filename = f"logs/{timestamp}_{test_id}.log"
+        log_filename = f"logs/{self.run_tag}_{next(self.log_sequence):03d}_{test_id}.log"
         result = TestResult(config_str, test_id, False, 0.0, log_filename)
 
         try:
@@ -183,181 +276,242 @@ class TestRunner:
                 self.logger.info("  Building configuration...")
             else:
                 self.logger.info("  Running test...")
-            self.logger.info(f"    Command: {' '.join(run_cmd)}")
+            self.logger.info("    Command: %s", shlex.join(run_cmd))
 
-            # Run phase with real-time output streaming
-            stdout_lines = []
-            stderr_lines = []
+            # Run phase: output is streamed to the log file, only the tail is kept in memory
+            stdout_tail = deque(maxlen=OUTPUT_TAIL_LINES)
+            stderr_tail = deque(maxlen=OUTPUT_TAIL_LINES)
+            saw_completed = False
+            saw_violation = False
             return_code = None
 
-            try:
-                with subprocess.Popen(
-                    run_cmd,
-                    cwd=self.board_dir,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    bufsize=1,  # Line buffered
-                    universal_newlines=True
-                ) as process:
-
-                    # Create threads to read stdout and stderr
-                    def read_stream(stream, line_list, stream_name):
-                        try:
-                            for line in iter(stream.readline, ''):
-                                if line:
-                                    line_clean = line.rstrip()
-                                    line_list.append(line_clean)
-                                    # Print with prefix to distinguish streams
-                                    if stream_name == 'STDOUT':
-                                        print(f"[{test_id}] {line_clean}")
-                                    else:
-                                        print(f"[{test_id}] ERROR: {line_clean}")
-                        except Exception as e:
-                            print(f"[{test_id}] Stream read error ({stream_name}): {e}")
-
-                    stdout_thread = threading.Thread(
-                        target=read_stream,
-                        args=(process.stdout, stdout_lines, 'STDOUT')
-                    )
-                    stderr_thread = threading.Thread(
-                        target=read_stream,
-                        args=(process.stderr, stderr_lines, 'STDERR')
-                    )
-
-                    stdout_thread.start()
-                    stderr_thread.start()
-
-                    # Wait for process with timeout
-                    try:
-                        return_code = process.wait(timeout=120)  # Max 2 minutes per test
-                    except subprocess.TimeoutExpired:
-                        print(f"[{test_id}] TIMEOUT - Killing process...")
-                        process.kill()
-                        return_code = -1
-
-                    # Wait for threads to finish reading remaining output
-                    stdout_thread.join(timeout=1.0)
-                    stderr_thread.join(timeout=1.0)
-
-            except Exception as e:
-                print(f"[{test_id}] Process error: {e}")
-                return_code = -1
-
-            result.duration = time.time() - start_time
-            result.output = '\n'.join(stdout_lines)
-            result.error = '\n'.join(stderr_lines)
-
-            # Save full output to individual log file
-            try:
-                with open(log_filename, 'w') as f:
-                    f.write(f"Test ID: {test_id}\n")
-                    f.write(f"Config: {config_str}\n")
-                    f.write(f"Build Mode: {'Release' if self.release_mode else 'Debug'}\n")
-                    f.write(f"Duration: {result.duration:.1f}s\n")
-                    f.write(f"Return code: {return_code}\n")
-                    f.write("=" * 80 + "\n")
-                    f.write("STDOUT:\n")
-                    f.write(result.output)
-                    f.write("\n" + "=" * 80 + "\n")
-                    f.write("STDERR:\n")
-                    f.write(result.error)
-                self.logger.info(f"  Full log saved to: {log_filename}")
-            except Exception as e:
-                self.logger.warning(f"  Failed to save log file: {e}")
+            log_file = open(log_filename, 'w', buffering=LOG_BUFFER_SIZE)
+            log_file.write("".join([
+                f"Test ID: {test_id}\n",
+                f"Config: {config_str}\n",
+                f"Build Mode: {'Release' if self.release_mode else 'Debug'}\n",
+                "=" * 80 + "\n",
+            ]))
+
+            with log_file:
+                try:
+                    with self.start_process(run_cmd, target_dir) as process:
+
+                        def handle_line(raw_line, line_list, stream_name):
+                            nonlocal saw_completed, saw_violation
+                            line_clean = raw_line.decode(errors='replace').rstrip()
+                            line_list.append(line_clean)
+                            log_file.write(f"[{stream_name}] {line_clean}\n")
+                            if stream_name == 'STDOUT':
+                                if TEST_COMPLETED in line_clean:
+                                    saw_completed = True
+                                if MONOTONIC_VIOLATION in line_clean:
+                                    saw_violation = True
+                            if self.stream_output:
+                                # Prefix to distinguish streams
+                                if stream_name == 'STDOUT':
+                                    sys.stdout.write(f"[{test_id}] {line_clean}\n")
+                                else:
+                                    sys.stdout.write(f"[{test_id}] ERROR: {line_clean}\n")
+
+                        # Read stdout and stderr from a single selector loop
+                        deadline = time.monotonic() + 120  # Max 2 minutes per test
+                        timed_out = False
+                        with selectors.DefaultSelector() as selector:
+                            for stream, line_list, stream_name in ((process.stdout, stdout_tail, 'STDOUT'),
+                                                                   (process.stderr, stderr_tail, 'STDERR')):
+                                os.set_blocking(stream.fileno(), False)
+                                selector.register(stream.fileno(), selectors.EVENT_READ,
+                                                  (line_list, stream_name, bytearray()))
+
+                            while selector.get_map():
+                                remaining = deadline - time.monotonic()
+                                if remaining <= 0:
+                                    timed_out = True
+                                    break
+                                for key, _ in selector.select(timeout=remaining):
+                                    line_list, stream_name, pending = key.data
+                                    try:
+                                        chunk = os.read(key.fd, 65536)
+                                    except BlockingIOError:
+                                        continue
+                                    except OSError as e:
+                                        self.logger.warning("  [%s] Stream read error (%s): %s", test_id, stream_name, e)
+                                        chunk = b""
+                                    if not chunk:
+                                        # EOF: flush any unterminated last line
+                                        selector.unregister(key.fd)
+                                        if pending:
+                                            handle_line(pending, line_list, stream_name)
+                                        continue
+                                    pending.extend(chunk)
+                                    *lines, rest = pending.split(b"\n")
+                                    pending[:] = rest
+                                    for raw_line in lines:
+                                        handle_line(raw_line, line_list, stream_name)
+
+                        if not timed_out:
+                            try:
+                                return_code = process.wait(timeout=max(deadline - time.monotonic(), 0))
+                            except subprocess.TimeoutExpired:
+                                timed_out = True
+
+                        if timed_out:
+                            self.logger.error("  [%s] TIMEOUT - Killing process...", test_id)
+                            self.signal_process_group(process, signal.SIGKILL)
+                            return_code = -1
+                        with self.process_lock:
+                            self.active_processes.discard(process)
+
+                except Exception as e:
+                    self.logger.error("  [%s] Process error: %s", test_id, e)
+                    return_code = -1
+
+                result.duration = time.time() - start_time
+                log_file.write("".join([
+                    "=" * 80 + "\n",
+                    f"Duration: {result.duration:.1f}s\n",
+                    f"Return code: {return_code}\n",
+                ]))
+
+            result.output = '\n'.join(stdout_tail)
+            result.error = '\n'.join(stderr_tail)
+            self.logger.info("  Full log saved to: %s", log_filename)
 
             # Check for success indicators
             if self.build_only:
                 # For build-only, success is just a clean build
                 if return_code == 0:
                     result.success = True
-                    self.logger.info(f"  BUILD SUCCESS ({result.duration:.1f}s)")
+                    self.logger.info("  BUILD SUCCESS (%.1fs)", result.duration)
                 else:
                     result.success = False
-                    self.logger.warning(f"  BUILD FAILED ({result.duration:.1f}s)")
+                    self.logger.warning("  BUILD FAILED (%.1fs)", result.duration)
                     if return_code != 0:
-                        self.logger.warning(f"    Non-zero exit code: {return_code}")
+                        self.logger.warning("    Non-zero exit code: %s", return_code)
+                    self.log_output_tail(result)
             else:
                 # For run mode, check for test completion
-                if ("Test completed" in result.output and
-                    "Timer monotonic violation" not in result.output and
-                    return_code == 0):
+                if saw_completed and not saw_violation and return_code == 0:
                     result.success = True
-                    self.logger.info(f"  SUCCESS ({result.duration:.1f}s)")
+                    self.logger.info("  SUCCESS (%.1fs)", result.duration)
                 else:
-                    self.logger.warning(f"  COMPLETED WITH WARNINGS ({result.duration:.1f}s)")
-                    if "Timer monotonic violation" in result.output:
+                    self.logger.warning("  COMPLETED WITH WARNINGS (%.1fs)", result.duration)
+                    if saw_violation:
                         self.logger.warning("    Monotonic violation detected!")
                     if return_code != 0:
-                        self.logger.warning(f"    Non-zero exit code: {return_code}")
+                        self.logger.warning("    Non-zero exit code: %s", return_code)
                     result.success = False
-
-        except subprocess.TimeoutExpired as e:
-            result.duration = time.time() - start_time
-            result.error = "Test timed out (this shouldn't happen with new streaming implementation)"
-            self.logger.error(f"  TIMEOUT after {result.duration:.1f}s")
-
-            # Save timeout info to log file
-            try:
-                with open(log_filename, 'w') as f:
-                    f.write(f"Test ID: {test_id}\n")
-                    f.write(f"Config: {config_str}\n")
-                    f.write(f"Build Mode: {'Release' if self.release_mode else 'Debug'}\n")
-                    f.write(f"Duration: {result.duration:.1f}s (TIMEOUT)\n")
-                    f.write("=" * 80 + "\n")
-                    f.write("TIMEOUT - Test exceeded 120 seconds\n")
-            except Exception as log_e:
-                self.logger.warning(f"  Failed to save timeout log: {log_e}")
+                    self.log_output_tail(result)
 
         except Exception as e:
             result.duration = time.time() - start_time
             result.error = f"Exception: {str(e)}"
             result.output = f"Exception occurred: {str(e)}"
-            self.logger.error(f"  EXCEPTION: {str(e)}")
+            self.logger.error("  EXCEPTION: %s", e)
 
-            # Save exception info to log file
+            # Save exception info to log file, after any output already streamed there
             try:
-                with open(log_filename, 'w') as f:
-                    f.write(f"Test ID: {test_id}\n")
-                    f.write(f"Config: {config_str}\n")
-                    f.write(f"Build Mode: {'Release' if self.release_mode else 'Debug'}\n")
-                    f.write(f"Duration: {result.duration:.1f}s (EXCEPTION)\n")
-                    f.write(f"Return code: N/A\n")
-                    f.write("=" * 80 + "\n")
-                    f.write(f"EXCEPTION: {str(e)}\n")
+                if os.path.exists(log_filename):
+                    body = ""
+                else:
+                    body = "".join([
+                        f"Test ID: {test_id}\n",
+                        f"Config: {config_str}\n",
+                        f"Build Mode: {'Release' if self.release_mode else 'Debug'}\n",
+                    ])
+                body += "".join([
+                    "=" * 80 + "\n",
+                    f"Duration: {result.duration:.1f}s (EXCEPTION)\n",
+                    "Return code: N/A\n",
+                    f"EXCEPTION: {str(e)}\n",
+                ])
+                with open(log_filename, 'a') as f:
+                    f.write(body)
             except Exception as log_e:
-                self.logger.warning(f"  Failed to save exception log: {log_e}")
+                self.logger.warning("  Failed to save exception log: %s", log_e)
 
         return result
 
+    def start_process(self, run_cmd: List[str], target_dir: str) -> subprocess.Popen:
+        """Start a cargo child and register it, unless the run is being stopped."""
+        with self.process_lock:
+            if self.stop_requested.is_set():
+                raise KeyboardInterrupt
+            process = subprocess.Popen(
+                run_cmd,
+                cwd=self.board_dir,
+                env=self.cargo_env(target_dir),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=0,
+                # Our pipes are non-inheritable, so skip scanning for fds to close
+                close_fds=False,
+                # Own process group, so a kill also reaches cargo's rustc/probe-rs children
+                start_new_session=True
+            )
+            self.active_processes.add(process)
+        return process
+
+    def signal_process_group(self, process: subprocess.Popen, sig: int):
+        """Signal a child started by run_single_test along with everything it spawned."""
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            pass
+
+    def stop_active_processes(self):
+        """Stop all running children (children don't receive the terminal's Ctrl-C).
+
+        They get SIGINT first, so probe-rs can halt the target and detach cleanly;
+        process groups still alive after INTERRUPT_GRACE_PERIOD are killed.
+        """
+        with self.process_lock:
+            self.stop_requested.set()
+            processes = list(self.active_processes)
+        for process in processes:
+            self.signal_process_group(process, signal.SIGINT)
+
+        deadline = time.monotonic() + INTERRUPT_GRACE_PERIOD
+        for process in processes:
+            try:
+                process.wait(timeout=max(deadline - time.monotonic(), 0))
+            except subprocess.TimeoutExpired:
+                pass
+            # No-op if the whole group has already exited
+            self.signal_process_group(process, signal.SIGKILL)
+
+    def log_output_tail(self, result: TestResult):
+        """Show the end of a failed test's output when it wasn't streamed live."""
+        if self.stream_output:
+            return
+        if result.output:
+            self.logger.warning("    STDOUT tail:\n%s", result.output[-FAILURE_TAIL_CHARS:])
+        if result.error:
+            self.logger.warning("    STDERR tail:\n%s", result.error[-FAILURE_TAIL_CHARS:])
+
     def find_config_by_id(self, test_id: str) -> Optional[Tuple[str, str, str, str, str]]:
         """Find configuration by test ID."""
-        all_configs = self.generate_all_configs()
-        for config in all_configs:
-            if self.config_to_id(config) == test_id:
-                return config
-        return None
+        return self._by_id.get(test_id)
 
     def run_all_tests(self):
         """Run all test configurations in order."""
+        self.run_start = time.monotonic()
         if self.specific_test_id:
             # Run only the specific test
             config = self.find_config_by_id(self.specific_test_id)
             if not config:
-                self.logger.error(f"Test ID '{self.specific_test_id}' not found!")
+                self.logger.error("Test ID '%s' not found!", self.specific_test_id)
                 self.logger.info("Available test IDs:")
                 all_configs = self.generate_all_configs()
                 for cfg in sorted(all_configs):
                     test_id = self.config_to_id(cfg)
-                    self.logger.info(f"  {test_id}: {self.config_to_string(cfg)}")
+                    self.logger.info("  %s: %s", test_id, self.config_to_string(cfg))
                 return
 
-            self.logger.info(f"Running single test: {self.specific_test_id}")
-            self.logger.info(f"Config: {self.config_to_string(config)}")
-            result = self.run_single_test(config)
-            self.results.append(result)
-            if not result.success:
-                self.failed_tests.append(result)
+            self.logger.info("Running single test: %s", self.specific_test_id)
+            self.logger.info("Config: %s", self.config_to_string(config))
+            self.record_result(self.run_single_test(config))
             self.print_summary()
             return
 
@@ -365,41 +519,81 @@ class TestRunner:
 
         # Show filtering information
         if not self.include_invalid:
-            all_configs_with_invalid = list(product(
-                self.freq_options, self.block_options, self.duration_options,
-                self.reload_options, self.priority_options
-            ))
-            invalid_count = len([c for c in all_configs_with_invalid if self.is_config_invalid(c)])
-            self.logger.info(f"Filtering out {invalid_count} invalid configurations (use --include-invalid to test them)")
+            self.logger.info("Filtering out %d invalid configurations (use --include-invalid to test them)", self._invalid_count)
             build_mode = "release" if self.release_mode else "debug"
             if not self.release_mode:
-                self.logger.info(f"Debug mode: Excluding blocking configs (critical_section overhead causes ISR starvation)")
-            self.logger.info(f"Always excluded: priority-timers-high (violates design constraints in {build_mode} mode)")
+                self.logger.info("Debug mode: Excluding blocking configs (critical_section overhead causes ISR starvation)")
+            self.logger.info("Always excluded: priority-timers-high (violates design constraints in %s mode)", build_mode)
 
-        # Sort to run short-duration tests first
-        all_configs.sort(key=lambda x: (
-            0 if x[2] == "duration-short" else 1,  # duration first
-            x[0], x[1], x[3]  # then other options
+        # Sort to run short-duration tests first, then by the other options
+        all_configs.sort(key=lambda c: (
+            self._DURATION_RANK[c[2]], self._FREQ_RANK[c[0]], self._BLOCK_RANK[c[1]], self._RELOAD_RANK[c[3]]
         ))
 
-        self.logger.info(f"Running {len(all_configs)} test configurations...")
-        self.logger.info(f"Test order: short-duration tests first, then full-duration tests")
-        self.logger.info(f"Log file: {self.log_filename}")
+        self.logger.info("Running %d test configurations...", len(all_configs))
+        self.logger.info("Test order: short-duration tests first, then full-duration tests")
+        self.logger.info("Log file: %s", self.log_filename)
 
-        for i, config in enumerate(all_configs, 1):
-            self.logger.info(f"{'='*80}")
-            self.logger.info(f"Test {i}/{len(all_configs)}")
+        if self.build_only and self.jobs > 1:
+            self.run_tests_parallel(all_configs)
+        else:
+            self.run_tests_serial(all_configs)
 
-            result = self.run_single_test(config)
-            self.results.append(result)
+        self.print_summary()
 
-            if not result.success:
-                self.failed_tests.append(result)
+    def record_result(self, result: TestResult):
+        """Store a finished test result."""
+        self.results.append(result)
+        if not result.success:
+            self.failed_tests.append(result)
 
-            # Brief pause between tests
-            time.sleep(1)
+    def run_tests_serial(self, all_configs: List[Tuple[str, str, str, str, str]]):
+        """Run configurations one at a time (required when flashing a board)."""
+        self.warm_up(self.target_dir)
 
-        self.print_summary()
+        for i, config in enumerate(all_configs, 1):
+            self.logger.info("=" * 80)
+            self.logger.info("Test %d/%d", i, len(all_configs))
+
+            self.record_result(self.run_single_test(config))
+
+            # Brief pause between tests
+            if i < len(all_configs):
+                time.sleep(self.inter_test_delay)
+
+    def run_tests_parallel(self, all_configs: List[Tuple[str, str, str, str, str]]):
+        """Build configurations concurrently; cargo does the heavy lifting in each worker."""
+        workers = min(self.jobs, len(all_configs))
+        # Share the CPUs between concurrent cargo processes instead of each using all of them
+        self.cargo_jobs = max(1, (os.cpu_count() or 1) // workers)
+        self.logger.info("Building with %d parallel workers", workers)
+
+        worker_dirs = [f"{self.target_dir}-{n}" for n in range(workers)]
+        for target_dir in worker_dirs:
+            self.target_dirs.put(target_dir)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(self.warm_up, worker_dirs))
+            futures = {executor.submit(self.run_in_worker_dir, config): config for config in all_configs}
+            try:
+                for i, future in enumerate(as_completed(futures), 1):
+                    result = future.result()
+                    self.record_result(result)
+                    status = "OK" if result.success else "FAILED"
+                    self.logger.info("Completed %d/%d: [%s] %s", i, len(all_configs), result.test_id, status)
+            except KeyboardInterrupt:
+                # Drop queued builds and stop running ones so the executor can shut down
+                executor.shutdown(wait=False, cancel_futures=True)
+                self.stop_active_processes()
+                raise
+
+    def run_in_worker_dir(self, config: Tuple[str, str, str, str, str]) -> TestResult:
+        """Run a test using a target directory no other worker currently holds."""
+        target_dir = self.target_dirs.get()
+        try:
+            return self.run_single_test(config, target_dir)
+        finally:
+            self.target_dirs.put(target_dir)
 
     def print_summary(self):
         """Print test results summary."""
@@ -437,11 +631,35 @@ class TestRunner:
             avg_full = sum(r.duration for r in full_tests) / len(full_tests)
             self.logger.info(f"Average full test duration: {avg_full:.1f}s")
 
+        if self.run_start is not None:
+            elapsed = time.monotonic() - self.run_start
+            self.logger.info(f"Elapsed time: {elapsed/60:.1f} minutes")
+
         total_time = sum(r.duration for r in self.results)
-        self.logger.info(f"Total test time: {total_time/60:.1f} minutes")
+        self.logger.info(f"Total test time: {total_time/60:.1f} minutes (sum of per-test durations)")
 
         self.logger.info(f"Complete log saved to: {self.log_filename}")
 
+def positive_int(value: str) -> int:
+    """argparse type for worker counts: an int >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return number
+
+def non_negative_float(value: str) -> float:
+    """argparse type for delays: a float >= 0."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: '{value}'")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {value}")
+    return number
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -495,6 +713,21 @@ Invalid configurations are skipped by default. Use --include-invalid to test the
         default="auto",
         help="Target board (auto-detect by default)"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=positive_int,
+        help="Number of parallel builds with --build-only (default: CPU count)"
+    )
+    parser.add_argument(
+        "--inter-test-delay",
+        type=non_negative_float,
+        help="Seconds to pause between serial tests (default: 1.0, or 0.1 with --build-only)"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Echo build/test output live (default: capture it and show the tail on failure)"
+    )
 
     args = parser.parse_args()
 
@@ -534,7 +767,7 @@ Invalid configurations are skipped by default. Use --include-invalid to test the
     print(f"Using board: {board_dir}")
     print()
 
-    runner = TestRunner(board_dir, args.test_id, not args.debug, args.include_invalid, args.build_only)
+    runner = TestRunner(board_dir, args.test_id, not args.debug, args.include_invalid, args.build_only, args.jobs, args.stream, args.inter_test_delay)
 
     if args.list_tests:
         print("Available test IDs:")
@@ -548,9 +781,13 @@ Invalid configurations are skipped by default. Use --include-invalid to test the
     try:
         runner.run_all_tests()
     except KeyboardInterrupt:
+        runner.stop_active_processes()
         runner.logger.info("Test run interrupted by user")
         runner.print_summary()
         sys.exit(1)
+    finally:
+        # Flush queued log records
+        runner.log_listener.stop()
 
 if __name__ == "__main__":
     main()